@@ -5,15 +5,54 @@ and Rust-accelerated functions.
 """
 
 import time
+import timeit
+from functools import partial
 
+WARMUP_BUDGET = 0.01  # seconds
+MAX_WARMUP_CALLS = 10
 
-def benchmark(func, *args, iterations=10000):
-    """Run a benchmark and return average execution time."""
+TIMING_ROW = "{label:<20}{ms:.4f} ms per call"
+SPEEDUP_ROW = "{label:<20}{speedup:.2f}x"
+
+
+def warmup(func):
+    """Warm caches for roughly WARMUP_BUDGET seconds, scaled to call cost."""
     start = time.perf_counter()
-    for _ in range(iterations):
-        func(*args)
-    end = time.perf_counter()
-    return (end - start) / iterations * 1000  # Return ms per call
+    func()
+    elapsed = time.perf_counter() - start
+    if elapsed > 0:
+        calls = max(1, min(MAX_WARMUP_CALLS, int(WARMUP_BUDGET / elapsed)))
+    else:
+        calls = MAX_WARMUP_CALLS
+    for _ in range(calls - 1):
+        func()
+
+
+def benchmark(func, *args, iterations=None, repeat=5):
+    """Run a benchmark and return the best average execution time.
+
+    When ``iterations`` is None the loop count is calibrated with
+    ``Timer.autorange``, which also warms the target up. The result is the
+    fastest of ``repeat`` runs, in milliseconds per call.
+    """
+    call = partial(func, *args)
+    # timeit calls the target straight from its own loop with GC disabled,
+    # which drops our wrapper frame and collector pauses from the timing.
+    # The loop itself is still Python, so each call keeps its dispatch cost.
+    timer = timeit.Timer(call)
+    if iterations is None:
+        iterations, _ = timer.autorange()
+    else:
+        warmup(call)
+    best = min(timer.repeat(repeat=repeat, number=iterations))
+    return best / iterations * 1000
+
+
+def report_comparison(baseline_label, baseline_ms, rust_label, rust_ms):
+    """Print a baseline/Rust timing pair and the resulting speedup."""
+    print(TIMING_ROW.format(label=f"{baseline_label}:", ms=baseline_ms))
+    print(TIMING_ROW.format(label=f"{rust_label}:", ms=rust_ms))
+    print(SPEEDUP_ROW.format(label="Speedup:", speedup=baseline_ms / rust_ms))
 
 
 def main():
@@ -31,48 +70,41 @@ def main():
     print("\n1. Text Normalization")
     print("-" * 70)
 
-    # Python version
-    def python_normalize(text):
-        return durak.normalize_case(text)
+    # Bind the callables directly (or via partial) rather than through
+    # wrapper functions, so no extra Python frame is timed on either side.
+    python_normalize = partial(durak.normalize_case, mode="lower")
 
-    # Rust version
     try:
         from durak import _durak_core
 
-        def rust_normalize(text):
-            return _durak_core.fast_normalize(text)
+        rust_normalize = partial(
+            _durak_core.fast_normalize, lowercase=True, handle_turkish_i=True
+        )
 
         py_time = benchmark(python_normalize, test_text)
         rust_time = benchmark(rust_normalize, test_text)
 
-        print(f"Python normalize: {py_time:.4f} ms per call")
-        print(f"Rust normalize:   {rust_time:.4f} ms per call")
-        print(f"Speedup:          {py_time / rust_time:.2f}x")
+        report_comparison("Python normalize", py_time, "Rust normalize", rust_time)
 
     except ImportError:
         print("Rust extension not available. Run: maturin develop")
 
     # 2. Tokenization Benchmark
-    print("\n2. Tokenization with Offsets")
+    print("\n2. Tokenization")
     print("-" * 70)
 
-    # Python version
-    def python_tokenize(text):
-        return durak.tokenize_with_offsets(text)
-
-    # Rust version
     try:
         from durak import _durak_core
 
-        def rust_tokenize(text):
-            return _durak_core.tokenize_with_offsets(text)
+        # The pure-Python regex tokenizer is the baseline; durak's
+        # tokenize_with_offsets is the Rust function itself.
+        python_tokenize = durak.tokenize
+        rust_tokenize = _durak_core.tokenize_with_offsets
 
         py_time = benchmark(python_tokenize, large_text, iterations=1000)
         rust_time = benchmark(rust_tokenize, large_text, iterations=1000)
 
-        print(f"Python tokenize: {py_time:.4f} ms per call")
-        print(f"Rust tokenize:   {rust_time:.4f} ms per call")
-        print(f"Speedup:         {py_time / rust_time:.2f}x")
+        report_comparison("Python tokenize", py_time, "Rust tokenize", rust_time)
 
     except ImportError:
         print("Rust extension not available")
@@ -84,20 +116,13 @@ def main():
     try:
         from durak import _durak_core
 
-        # File-based loading
-        def load_from_file():
-            return durak.load_stopword_resource("base/turkish")
-
-        # Embedded Rust loading
-        def load_from_rust():
-            return _durak_core.get_stopwords_base()
+        load_from_file = partial(durak.load_stopword_resource, "base/turkish")
+        load_from_rust = _durak_core.get_stopwords_base
 
         file_time = benchmark(load_from_file, iterations=100)
         rust_time = benchmark(load_from_rust, iterations=100)
 
-        print(f"File-based load:   {file_time:.4f} ms per call")
-        print(f"Embedded Rust load: {rust_time:.4f} ms per call")
-        print(f"Speedup:            {file_time / rust_time:.2f}x")
+        report_comparison("File-based load", file_time, "Embedded Rust load", rust_time)
 
     except ImportError:
         print("Rust extension not available")
@@ -106,8 +131,10 @@ def main():
     print("\n4. Complete Processing Pipeline")
     print("-" * 70)
 
+    # Normalize the cleaned string in one pass before tokenizing; the
+    # normalize step takes text, not a token list.
     pipeline = durak.Pipeline(
-        ["clean", "tokenize", "remove_stopwords", "normalize"]
+        ["clean", "normalize", "tokenize", "remove_stopwords"]
     )
 
     pipeline_time = benchmark(pipeline, large_text, iterations=100)
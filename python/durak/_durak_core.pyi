@@ -36,6 +36,30 @@ def fast_normalize(
     """
     ...
 
+def fast_normalize_batch(
+    texts: list[str],
+    lowercase: bool = True,
+    handle_turkish_i: bool = True,
+) -> list[str]:
+    """Normalize a list of texts in one call.
+
+    Equivalent to calling fast_normalize on each text, but crosses the
+    Python/Rust boundary once and releases the GIL while normalizing.
+
+    Args:
+        texts: The texts to normalize
+        lowercase: If True, convert text to lowercase (default: True)
+        handle_turkish_i: If True, handle Turkish I/ı/İ/i conversion (default: True)
+
+    Returns:
+        Normalized texts, in input order
+
+    Examples:
+        >>> fast_normalize_batch(["İSTANBUL", "IŞIK"])
+        ['istanbul', 'ışık']
+    """
+    ...
+
 def tokenize_with_offsets(text: str) -> list[tuple[str, int, int]]:
     """Tokenize text and return tokens with their character offsets.
 
@@ -66,6 +90,28 @@ def tokenize_with_offsets(text: str) -> list[tuple[str, int, int]]:
     """
     ...
 
+def tokenize_with_normalized_offsets_batch(
+    texts: list[str],
+) -> list[list[tuple[str, int, int]]]:
+    """Tokenize a list of texts into normalized tokens with original offsets.
+
+    Equivalent to calling tokenize_with_normalized_offsets on each text, but
+    crosses the Python/Rust boundary once and releases the GIL while
+    tokenizing.
+
+    Args:
+        texts: The texts to tokenize
+
+    Returns:
+        One list of (normalized_token, start, end) tuples per text, in input
+        order. Offsets are character indices into the corresponding raw text.
+
+    Examples:
+        >>> tokenize_with_normalized_offsets_batch(["İstanbul", "IĞDIR'a"])
+        [[('istanbul', 0, 8)], [("ığdır'a", 0, 7)]]
+    """
+    ...
+
 def lookup_lemma(word: str) -> str | None:
     """Perform exact dictionary lookup for lemmatization.
 
@@ -94,6 +140,24 @@ def lookup_lemma(word: str) -> str | None:
     """
     ...
 
+def lookup_lemma_batch(words: list[str]) -> list[str | None]:
+    """Perform exact dictionary lookup for a list of words in one call.
+
+    Equivalent to ``[lookup_lemma(w) for w in words]`` with a single
+    Python/Rust crossing.
+
+    Args:
+        words: The inflected words to lemmatize
+
+    Returns:
+        The base lemma for each word, or None where it is not in the dictionary
+
+    Examples:
+        >>> lookup_lemma_batch(["kitaplar", "unknown"])
+        ['kitap', None]
+    """
+    ...
+
 def strip_suffixes(word: str) -> str:
     """Heuristic suffix stripping for Turkish morphology.
 
@@ -115,6 +179,44 @@ def strip_suffixes(word: str) -> str:
     """
     ...
 
+def strip_suffixes_batch(words: list[str]) -> list[str]:
+    """Heuristic suffix stripping for a list of words in one call.
+
+    Equivalent to ``[strip_suffixes(w) for w in words]`` with a single
+    Python/Rust crossing.
+
+    Args:
+        words: The words to strip suffixes from
+
+    Returns:
+        The words with suffixes removed, in input order
+
+    Examples:
+        >>> strip_suffixes_batch(["kitaplardan", "geliyorum"])
+        ['kitap', 'gel']
+    """
+    ...
+
+def lemmatize_hybrid(word: str) -> str:
+    """Dictionary lookup with heuristic fallback in a single call.
+
+    Equivalent to ``lookup_lemma(word) or strip_suffixes(word)`` without a
+    second Python/Rust crossing on dictionary misses.
+
+    Args:
+        word: The word to lemmatize
+
+    Returns:
+        The dictionary lemma if known, otherwise the suffix-stripped word
+
+    Examples:
+        >>> lemmatize_hybrid("kitaplar")
+        'kitap'
+        >>> lemmatize_hybrid("kitaplardan")
+        'kitap'
+    """
+    ...
+
 def strip_suffixes_validated(
     word: str,
     strict: bool = False,
@@ -241,9 +343,14 @@ def get_stopwords_social_media() -> list[str]:
 
 __all__ = [
     "fast_normalize",
+    "fast_normalize_batch",
     "tokenize_with_offsets",
+    "tokenize_with_normalized_offsets_batch",
     "lookup_lemma",
+    "lookup_lemma_batch",
     "strip_suffixes",
+    "strip_suffixes_batch",
+    "lemmatize_hybrid",
     "strip_suffixes_validated",
     "check_vowel_harmony_py",
     "get_detached_suffixes",
@@ -6,7 +6,7 @@ import html
 import re
 import unicodedata
 from collections.abc import Iterable
-from functools import partial
+from functools import cache, partial
 from typing import Callable
 
 from durak.exceptions import ConfigurationError
@@ -21,6 +21,7 @@ UNICODE_REPLACEMENTS = {
     "\u2013": "-",
     "\u00a0": " ",
 }
+UNICODE_TRANSLATION_TABLE = str.maketrans(UNICODE_REPLACEMENTS)
 
 # Replace script/style blocks before stripping tags to avoid leaking JS/CSS.
 SCRIPT_STYLE_PATTERN = re.compile(
@@ -31,9 +32,15 @@ URL_PATTERN = re.compile(r"(?P<url>(https?://|www\.)[^\s]+)", flags=re.IGNORECAS
 MENTION_PATTERN = re.compile(r"(?<!\w)@[^\s#@]+", flags=re.UNICODE)
 HASHTAG_PATTERN = re.compile(r"(?<!\w)#[^\s#@]+", flags=re.UNICODE)
 WHITESPACE_PATTERN = re.compile(r"\s+")
+SPACE_BEFORE_PUNCT_PATTERN = re.compile(r"\s+([.,!?;:])")
 
 TRAILING_PUNCTUATION = {".", ",", "!", "?", ";", ":"}
 
+# Turkish-specific case pairs that str.lower()/str.upper() get wrong, applied
+# in one translate() pass before the generic case mapping.
+TURKISH_LOWER_TABLE = str.maketrans({"I": "ı", "İ": "i", "Â": "â", "Î": "î", "Û": "û"})
+TURKISH_UPPER_TABLE = str.maketrans({"i": "İ", "ı": "I", "â": "Â", "î": "Î", "û": "Û"})
+
 # Emoji pattern: comprehensive Unicode emoji ranges
 # Covers emoji characters, emoji modifiers, and emoji sequences
 # Note: No '+' quantifier to match individual emojis, not consecutive groups
@@ -79,9 +86,10 @@ def normalize_unicode(text: str) -> str:
     """Apply NFC normalization and map variants to standard characters."""
     if not text:
         return ""
-    normalized = unicodedata.normalize("NFC", text)
-    translation_table = str.maketrans(UNICODE_REPLACEMENTS)
-    return normalized.translate(translation_table)
+    # The quick check answers for already-composed text without building a copy.
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return text.translate(UNICODE_TRANSLATION_TABLE)
 
 
 def strip_html(text: str) -> str:
@@ -99,7 +107,7 @@ def collapse_whitespace(text: str) -> str:
     if not text:
         return ""
     collapsed = WHITESPACE_PATTERN.sub(" ", text).strip()
-    return re.sub(r"\s+([.,!?;:])", r"\1", collapsed)
+    return SPACE_BEFORE_PUNCT_PATTERN.sub(r"\1", collapsed)
 
 
 def normalize_case(text: str, mode: str = "lower") -> str:
@@ -108,23 +116,9 @@ def normalize_case(text: str, mode: str = "lower") -> str:
         return text
 
     if mode == "lower":
-        adjusted = (
-            text.replace("I", "ı")
-            .replace("İ", "i")
-            .replace("Â", "â")
-            .replace("Î", "î")
-            .replace("Û", "û")
-        )
-        return adjusted.lower()
+        return text.translate(TURKISH_LOWER_TABLE).lower()
     if mode == "upper":
-        adjusted = (
-            text.replace("i", "İ")
-            .replace("ı", "I")
-            .replace("â", "Â")
-            .replace("î", "Î")
-            .replace("û", "Û")
-        )
-        return adjusted.upper()
+        return text.translate(TURKISH_UPPER_TABLE).upper()
 
     raise ConfigurationError(
         f"Unsupported mode '{mode}'. Expected 'lower', 'upper', or 'none'."
@@ -163,6 +157,11 @@ def remove_mentions_hashtags(text: str, *, keep_hash: bool = False) -> str:
     return collapse_whitespace(without_hashtags)
 
 
+@cache
+def _repeated_chars_pattern(max_repeats: int) -> re.Pattern[str]:
+    return re.compile(rf"(.)\1{{{max_repeats},}}")
+
+
 def remove_repeated_chars(text: str, *, max_repeats: int = 2) -> str:
     """Limit elongated characters and emojis to a maximum repeat threshold."""
     if not text:
@@ -170,13 +169,8 @@ def remove_repeated_chars(text: str, *, max_repeats: int = 2) -> str:
     if max_repeats < 1:
         raise ConfigurationError("max_repeats must be >= 1")
 
-    pattern = re.compile(rf"(.)\1{{{max_repeats},}}")
-
-    def replacer(match: re.Match[str]) -> str:
-        char = match.group(1)
-        return char * max_repeats
-
-    return pattern.sub(replacer, text)
+    pattern = _repeated_chars_pattern(max_repeats)
+    return pattern.sub(r"\1" * max_repeats, text)
 
 
 def remove_emojis(text: str) -> str:
@@ -15,10 +15,10 @@ import click
 
 from durak import (
     Lemmatizer,
-    StopwordManager,
     attach_detached_suffixes,
     clean_text,
     load_stopword_resource,
+    remove_stopwords,
     tokenize,
 )
 
@@ -81,7 +81,7 @@ def process(input_file: str, output: str | None, **kwargs: Any) -> None:
         tokens = attach_detached_suffixes(tokens)
 
     if kwargs["remove_stopwords"]:
-        tokens = [t for t in tokens if not StopwordManager().is_stopword(t)]
+        tokens = remove_stopwords(tokens)
 
     output_format = kwargs.get("format", "text")
 
@@ -173,7 +173,7 @@ def lemmatize(
     strategy_literal = cast(Literal["lookup", "heuristic", "hybrid"], strategy)
     lemmatizer_obj = Lemmatizer(strategy=strategy_literal, collect_metrics=metrics)
 
-    results = [lemmatizer_obj(token) for token in tokens]
+    results = lemmatizer_obj.lemmatize_many(tokens)
 
     output_format = kwargs.get("format", "text")
 
@@ -253,7 +253,7 @@ def tokenize_cmd(
         tokens = attach_detached_suffixes(tokens)
 
     if stopwords:
-        tokens = [t for t in tokens if not StopwordManager().is_stopword(t)]
+        tokens = remove_stopwords(tokens)
 
     output_format = kwargs.get("format", "text")
 
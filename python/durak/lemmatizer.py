@@ -1,24 +1,39 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from time import perf_counter
-from typing import TYPE_CHECKING, Literal
+from typing import Any, Callable, Literal, cast
 
 from durak.exceptions import ConfigurationError, LemmatizerError, RustExtensionError
 
-if TYPE_CHECKING:
-    pass
-
 try:
-    from durak._durak_core import lookup_lemma, strip_suffixes, strip_suffixes_validated
+    from durak._durak_core import (
+        lemmatize_hybrid,
+        lookup_lemma,
+        lookup_lemma_batch,
+        strip_suffixes,
+        strip_suffixes_batch,
+        strip_suffixes_validated,
+    )
 except ImportError:
 
+    def lemmatize_hybrid(word: str) -> str:
+        raise RustExtensionError("Rust extension not installed. Run: maturin develop")
+
     def lookup_lemma(word: str) -> str | None:
         raise RustExtensionError("Rust extension not installed. Run: maturin develop")
 
+    def lookup_lemma_batch(words: list[str]) -> list[str | None]:
+        raise RustExtensionError("Rust extension not installed. Run: maturin develop")
+
     def strip_suffixes(word: str) -> str:
         raise RustExtensionError("Rust extension not installed. Run: maturin develop")
 
+    def strip_suffixes_batch(words: list[str]) -> list[str]:
+        raise RustExtensionError("Rust extension not installed. Run: maturin develop")
+
     def strip_suffixes_validated(
         word: str,
         strict: bool = False,
@@ -118,6 +133,7 @@ class Lemmatizer:
         strict_validation: Require roots to be in lemma dictionary
         min_root_length: Minimum acceptable root length (characters)
         collect_metrics: Enable performance metrics collection (adds ~5-10% overhead)
+        cache_size: Memoize up to this many distinct words (0 disables caching)
     """
 
     def __init__(
@@ -127,6 +143,7 @@ class Lemmatizer:
         strict_validation: bool = False,
         min_root_length: int = 2,
         collect_metrics: bool = False,
+        cache_size: int = 0,
     ):
         valid_strategies = ("lookup", "heuristic", "hybrid")
         if strategy not in valid_strategies:
@@ -138,14 +155,87 @@ class Lemmatizer:
         if min_root_length < 1:
             raise ConfigurationError("min_root_length must be at least 1")
 
-        self.strategy: Strategy = strategy
-        self.validate_roots: bool = validate_roots
-        self.strict_validation: bool = strict_validation
-        self.min_root_length: int = min_root_length
-        self.collect_metrics: bool = collect_metrics
+        if cache_size < 0:
+            raise ConfigurationError("cache_size must be non-negative")
+
+        # Configuration is read-only: the per-word path below is resolved from
+        # it once, so changing it afterwards would have no effect
+        self._strategy: Strategy = strategy
+        self._validate_roots = validate_roots
+        self._strict_validation = strict_validation
+        self._min_root_length = min_root_length
+        self._collect_metrics = collect_metrics
         self._metrics: LemmatizerMetrics | None = (
             LemmatizerMetrics() if collect_metrics else None
         )
+        self._cache_size = cache_size
+
+        self._resolve_lemmatize()
+
+    def _resolve_lemmatize(self) -> None:
+        """Resolve the per-word path once so __call__ does no strategy dispatch."""
+        lemmatize: Callable[[str], str]
+        if self._collect_metrics:
+            lemmatize = self._lemmatize_with_metrics
+        elif self._strategy == "lookup":
+            lemmatize = self._lemmatize_lookup
+        elif self._strategy == "heuristic":
+            lemmatize = self._strip_suffixes
+        elif self._validate_roots:
+            lemmatize = self._lemmatize_hybrid
+        else:
+            # Lookup and unvalidated fallback in a single call into Rust
+            lemmatize = lemmatize_hybrid
+        # With metrics on, the cache sits behind the metrics wrapper so that
+        # cache hits are still counted
+        self._traced: Callable[[str], tuple[str, bool, float]] | None = None
+        if self._cache_size and self._collect_metrics:
+            self._traced = lru_cache(maxsize=self._cache_size)(self._lemmatize_traced)
+            lemmatize = self._lemmatize_with_cached_metrics
+        elif self._cache_size:
+            lemmatize = lru_cache(maxsize=self._cache_size)(lemmatize)
+        self._lemmatize = lemmatize
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The resolved path and its caches are bound to this instance; drop
+        # them so copies and unpickled instances rebuild their own
+        state = self.__dict__.copy()
+        del state["_lemmatize"], state["_traced"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._resolve_lemmatize()
+
+    @property
+    def strategy(self) -> Strategy:
+        """Lemmatization strategy (lookup, heuristic or hybrid)."""
+        return self._strategy
+
+    @property
+    def validate_roots(self) -> bool:
+        """Whether heuristic roots are validated."""
+        return self._validate_roots
+
+    @property
+    def strict_validation(self) -> bool:
+        """Whether validated roots must be in the lemma dictionary."""
+        return self._strict_validation
+
+    @property
+    def min_root_length(self) -> int:
+        """Minimum acceptable root length (characters)."""
+        return self._min_root_length
+
+    @property
+    def collect_metrics(self) -> bool:
+        """Whether performance metrics are collected."""
+        return self._collect_metrics
+
+    @property
+    def cache_size(self) -> int:
+        """Maximum number of memoized words (0 when caching is disabled)."""
+        return self._cache_size
 
     def __call__(self, word: str) -> str:
         """Lemmatize a word.
@@ -173,81 +263,157 @@ class Lemmatizer:
         except Exception as e:
             raise LemmatizerError(f"Lemmatization failed: {e}") from e
 
-    def _lemmatize(self, word: str) -> str:
-        """Internal lemmatization logic."""
-        if not self.collect_metrics:
-            return self._lemmatize_without_metrics(word)
-        return self._lemmatize_with_metrics(word)
+    def lemmatize_many(self, words: Iterable[str]) -> list[str]:
+        """Lemmatize a batch of words.
 
-    def _lemmatize_without_metrics(self, word: str) -> str:
-        """Fast path when metrics are disabled."""
-        if self.strategy in ("lookup", "hybrid"):
-            lemma = lookup_lemma(word)
-            if lemma is not None:
-                return lemma
-            if self.strategy == "lookup":
-                return word
-
-        if self.strategy in ("heuristic", "hybrid"):
-            if self.validate_roots:
-                return strip_suffixes_validated(
-                    word,
-                    strict=self.strict_validation,
-                    min_root_length=self.min_root_length,
+        Equivalent to ``[lemmatizer(word) for word in words]`` but validates the
+        batch up front, runs the dictionary lookup over the whole batch and
+        only then applies the heuristic to the misses. This keeps per-word
+        overhead low when evaluating large word lists.
+
+        Args:
+            words: Words to lemmatize
+
+        Returns:
+            Lemmas in the same order as the input
+
+        Raises:
+            LemmatizerError: If any input is not a string
+            RustExtensionError: If Rust extension is not available
+        """
+        batch = list(words)
+        for word in batch:
+            if not isinstance(word, str):
+                raise LemmatizerError(
+                    f"Input must be a string, got {type(word).__name__}"
                 )
-            return strip_suffixes(word)
 
-        return word
+        try:
+            if self._collect_metrics or self._cache_size or (
+                self._strategy == "heuristic" and self._validate_roots
+            ):
+                lemmatize = self._lemmatize
+                return [lemmatize(word) if word else "" for word in batch]
+            return self._lemmatize_batch(batch)
+        except RustExtensionError:
+            raise
+        except Exception as e:
+            raise LemmatizerError(f"Lemmatization failed: {e}") from e
+
+    def _lemmatize_batch(self, batch: list[str]) -> list[str]:
+        """Two-pass batch path: dictionary lookups first, heuristic on misses.
+
+        Each pass crosses into Rust once for the whole batch.
+        """
+        if self._strategy == "heuristic":
+            stripped = strip_suffixes_batch(batch)
+            return [lemma if word else "" for word, lemma in zip(batch, stripped)]
+
+        lemmas = lookup_lemma_batch(batch)
+        misses = [i for i, lemma in enumerate(lemmas) if lemma is None]
+        if self._strategy == "lookup":
+            for i in misses:
+                lemmas[i] = batch[i]
+        elif self._validate_roots:
+            strip = self._strip_suffixes
+            for i in misses:
+                lemmas[i] = strip(batch[i]) if batch[i] else ""
+        else:
+            stripped = strip_suffixes_batch([batch[i] for i in misses])
+            for i, lemma in zip(misses, stripped):
+                lemmas[i] = lemma
+        return cast("list[str]", lemmas)
+
+    def _strip_suffixes(self, word: str) -> str:
+        """Run the configured heuristic suffix stripper."""
+        if self._validate_roots:
+            return strip_suffixes_validated(
+                word,
+                strict=self._strict_validation,
+                min_root_length=self._min_root_length,
+            )
+        return strip_suffixes(word)
+
+    def _lemmatize_lookup(self, word: str) -> str:
+        """Dictionary-only path; unknown words are returned unchanged."""
+        lemma = lookup_lemma(word)
+        return word if lemma is None else lemma
+
+    def _lemmatize_hybrid(self, word: str) -> str:
+        """Dictionary lookup with heuristic fallback on misses."""
+        lemma = lookup_lemma(word)
+        return self._strip_suffixes(word) if lemma is None else lemma
 
     def _lemmatize_with_metrics(self, word: str) -> str:
         """Metrics-tracked lemmatization path."""
+        lemma, lookup_hit, elapsed = self._lemmatize_traced(word)
+        self._record_call(lookup_hit, elapsed)
+        return lemma
+
+    def _lemmatize_with_cached_metrics(self, word: str) -> str:
+        """Metrics-tracked path in front of the lemma cache.
+
+        Every call is counted, including ones answered from the cache, with the
+        outcome it was cached with; phase timers only grow on cache misses.
+        """
+        assert self._traced is not None
+        start_time = perf_counter()
+        lemma, lookup_hit, _ = self._traced(word)
+        self._record_call(lookup_hit, perf_counter() - start_time)
+        return lemma
+
+    def _lemmatize_traced(self, word: str) -> tuple[str, bool, float]:
+        """Lemmatize while timing each phase.
+
+        Each phase boundary is timestamped once and shared between the phase
+        timer and the total, keeping clock reads to two or three per call.
+
+        Returns:
+            The lemma, whether the dictionary lookup hit, and the elapsed time
+        """
         metrics = self._metrics
         assert metrics is not None
 
         start_time = perf_counter()
+        heuristic_start = start_time
 
-        if self.strategy in ("lookup", "hybrid"):
-            lookup_start = perf_counter()
+        if self._strategy in ("lookup", "hybrid"):
             lemma = lookup_lemma(word)
-            metrics.lookup_time += perf_counter() - lookup_start
+            lookup_end = perf_counter()
+            metrics.lookup_time += lookup_end - start_time
 
             if lemma is not None:
-                metrics.lookup_hits += 1
-                metrics.total_calls += 1
-                metrics.total_time += perf_counter() - start_time
-                return lemma
-
-            metrics.lookup_misses += 1
-
-            if self.strategy == "lookup":
-                metrics.total_calls += 1
-                metrics.total_time += perf_counter() - start_time
-                return word
+                return lemma, True, lookup_end - start_time
+            if self._strategy == "lookup":
+                return word, False, lookup_end - start_time
 
-        if self.strategy in ("heuristic", "hybrid"):
-            heuristic_start = perf_counter()
+            heuristic_start = lookup_end
 
-            if self.validate_roots:
-                result = strip_suffixes_validated(
-                    word,
-                    strict=self.strict_validation,
-                    min_root_length=self.min_root_length,
-                )
-            else:
-                result = strip_suffixes(word)
+        result = self._strip_suffixes(word)
+        end_time = perf_counter()
+        metrics.heuristic_time += end_time - heuristic_start
+        return result, False, end_time - start_time
 
-            metrics.heuristic_time += perf_counter() - heuristic_start
+    def _record_call(self, lookup_hit: bool, elapsed: float) -> None:
+        metrics = self._metrics
+        assert metrics is not None
+        metrics.total_calls += 1
+        metrics.total_time += elapsed
+        if lookup_hit:
+            metrics.lookup_hits += 1
+            return
+        if self._strategy != "heuristic":
+            metrics.lookup_misses += 1
+        if self._strategy != "lookup":
             metrics.heuristic_calls += 1
-            metrics.total_calls += 1
-            metrics.total_time += perf_counter() - start_time
-
-            return result
-
-        return word
 
     def get_metrics(self) -> LemmatizerMetrics:
         """Return collected metrics.
 
+        The result is a snapshot with derived rates computed once: later
+        calls are not reflected in it, so call ``get_metrics()`` again to see
+        updated counts.
+
         Returns:
             LemmatizerMetrics: Performance metrics snapshot
 
@@ -258,8 +424,7 @@ class Lemmatizer:
             raise ConfigurationError(
                 "Metrics not enabled. Initialize with collect_metrics=True."
             )
-        self._metrics.__post_init__()
-        return self._metrics
+        return replace(self._metrics)
 
     def reset_metrics(self) -> None:
         """Reset all metrics to zero.
@@ -272,12 +437,48 @@ class Lemmatizer:
         Raises:
             ConfigurationError: If metrics collection is not enabled
         """
-        if not self.collect_metrics:
+        if not self._collect_metrics:
             raise ConfigurationError(
                 "Metrics not enabled. Initialize with collect_metrics=True."
             )
         self._metrics = LemmatizerMetrics()
 
+    def clear_cache(self) -> None:
+        """Drop all memoized lemmas.
+
+        Useful when comparing strategies or metrics across evaluation runs.
+
+        Raises:
+            ConfigurationError: If caching is not enabled
+        """
+        if not self._cache_size:
+            raise ConfigurationError(
+                "Caching not enabled. Initialize with cache_size > 0."
+            )
+        self._cached_function().cache_clear()
+
+    def cache_info(self) -> Any:
+        """Return hit/miss statistics for the lemma cache.
+
+        Metrics (when enabled) count every call, cached or not; use this to
+        see how many of them were answered from the cache.
+
+        Returns:
+            Named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``
+
+        Raises:
+            ConfigurationError: If caching is not enabled
+        """
+        if not self._cache_size:
+            raise ConfigurationError(
+                "Caching not enabled. Initialize with cache_size > 0."
+            )
+        return self._cached_function().cache_info()
+
+    def _cached_function(self) -> Any:
+        # The lru_cache wrapper; its type is private to functools
+        return self._traced if self._collect_metrics else self._lemmatize
+
     def __repr__(self) -> str:
         parts = [f"strategy='{self.strategy}'"]
         if self.validate_roots:
@@ -288,4 +489,6 @@ class Lemmatizer:
                 parts.append(f"min_root_length={self.min_root_length}")
         if self.collect_metrics:
             parts.append("collect_metrics=True")
+        if self.cache_size:
+            parts.append(f"cache_size={self.cache_size}")
         return f"Lemmatizer({', '.join(parts)})"
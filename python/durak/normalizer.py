@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from durak.exceptions import NormalizerError, RustExtensionError
 
 try:
-    from durak._durak_core import fast_normalize
+    from durak._durak_core import fast_normalize, fast_normalize_batch
 except ImportError:
 
     def fast_normalize(
@@ -15,6 +17,13 @@ except ImportError:
     ) -> str:
         raise RustExtensionError("Rust extension not installed. Run: maturin develop")
 
+    def fast_normalize_batch(
+        texts: list[str],
+        lowercase: bool = True,
+        handle_turkish_i: bool = True,
+    ) -> list[str]:
+        raise RustExtensionError("Rust extension not installed. Run: maturin develop")
+
 
 class Normalizer:
     """
@@ -48,7 +57,11 @@ class Normalizer:
 
         if not text:
             return ""
-        
+
+        # With every transform disabled there is nothing for the backend to do
+        if not (self.lowercase or self.handle_turkish_i):
+            return text
+
         # Pass configuration parameters to Rust core
         return fast_normalize(text, self.lowercase, self.handle_turkish_i)
         try:
@@ -62,6 +75,32 @@ class Normalizer:
         except Exception as e:
             raise NormalizerError(f"Normalization failed: {e}") from e
 
+    def normalize_many(self, texts: Iterable[str]) -> list[str]:
+        """
+        Normalize a batch of texts with a single call into the Rust core.
+
+        Args:
+            texts (Iterable[str]): Input strings.
+
+        Returns:
+            list[str]: Normalized strings, in input order.
+
+        Raises:
+            NormalizerError: If any input is not a string
+            RustExtensionError: If Rust extension is not available
+        """
+        batch = list(texts)
+        for text in batch:
+            if not isinstance(text, str):
+                raise NormalizerError(
+                    f"Input must be a string, got {type(text).__name__}"
+                )
+
+        if not batch:
+            return []
+
+        return fast_normalize_batch(batch, self.lowercase, self.handle_turkish_i)
+
     def __repr__(self) -> str:
         return (
             f"Normalizer(lowercase={self.lowercase}, "
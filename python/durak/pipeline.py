@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import re
 import warnings
+from collections.abc import Iterable
+from functools import cache
 from typing import Any, Callable, Union
 
 from durak.cleaning import (
@@ -19,7 +20,7 @@ from durak.exceptions import ConfigurationError, PipelineError
 from durak.normalizer import Normalizer
 from durak.stopwords import remove_stopwords as remove_stopwords_fn
 from durak.suffixes import attach_detached_suffixes
-from durak.tokenizer import PUNCT_TOKEN, tokenize
+from durak.tokenizer import PUNCT_TOKEN_PATTERN, tokenize
 
 STEP_REGISTRY: dict[str, Callable[..., Any]] = {
     "clean": clean_text,
@@ -30,6 +31,7 @@ STEP_REGISTRY: dict[str, Callable[..., Any]] = {
 }
 
 StepType = Union[str, Callable[..., Any]]
+TokenStep = Callable[[list[str]], list[str]]
 
 
 class Pipeline:
@@ -91,13 +93,44 @@ class Pipeline:
         Raises:
             PipelineError: If input is not a string or step execution fails
         """
+        return self._run(text, zip(self.step_names, self.steps))
+
+    def pipe(self, texts: Iterable[str]) -> list[str | list[str]]:
+        """
+        Process a batch of texts through the pipeline.
+
+        Equivalent to ``[pipeline(text) for text in texts]``, but the step list
+        is resolved once for the whole batch instead of once per document.
+
+        Args:
+            texts: Input texts to process
+
+        Returns:
+            Processed results in input order
+
+        Raises:
+            PipelineError: If any input is not a string or step execution fails
+
+        Examples:
+            >>> pipeline = Pipeline(["clean", "tokenize"])
+            >>> pipeline.pipe(["Merhaba dünya", "Nasılsın?"])
+            [['merhaba', 'dünya'], ['nasılsın', '?']]
+        """
+        steps = tuple(zip(self.step_names, self.steps))
+        run = self._run
+        return [run(text, steps) for text in texts]
+
+    @staticmethod
+    def _run(
+        text: str, steps: Iterable[tuple[str, Callable[..., Any]]]
+    ) -> str | list[str]:
         if not isinstance(text, str):
             raise PipelineError(
                 f"Pipeline input must be a string, got {type(text).__name__}"
             )
 
         doc: Any = text
-        for step_name, step in zip(self.step_names, self.steps):
+        for step_name, step in steps:
             try:
                 doc = step(doc)
             except Exception as e:
@@ -182,30 +215,51 @@ def process_text(
     if not text:
         return []
 
-    cleaned_result: str | tuple[str, list[str]]
-    if lowercase:
-        cleaned_result = clean_text(text)
-    else:
-        cleaned_result = collapse_whitespace(
-            remove_mentions_hashtags(
-                remove_repeated_chars(remove_urls(strip_html(normalize_unicode(text))))
-            )
-        )
+    clean, token_steps = _compile_process_steps(
+        remove_stopwords, rejoin_suffixes, lowercase, strip_punct
+    )
 
+    cleaned_result = clean(text)
     if isinstance(cleaned_result, tuple):
         cleaned = cleaned_result[0]
     else:
         cleaned = cleaned_result
+    if not cleaned:
+        return []
 
     tokens = tokenize(cleaned)
+    for step in token_steps:
+        tokens = step(tokens)
+    return tokens
 
-    if strip_punct:
-        tokens = [t for t in tokens if not re.fullmatch(PUNCT_TOKEN, t)]
 
-    if rejoin_suffixes:
-        tokens = attach_detached_suffixes(tokens)
+def _clean_preserving_case(text: str) -> str:
+    return collapse_whitespace(
+        remove_mentions_hashtags(
+            remove_repeated_chars(remove_urls(strip_html(normalize_unicode(text))))
+        )
+    )
 
-    if remove_stopwords:
-        tokens = remove_stopwords_fn(tokens)
 
-    return tokens
+def _strip_punct_tokens(tokens: list[str]) -> list[str]:
+    fullmatch = PUNCT_TOKEN_PATTERN.fullmatch
+    return [t for t in tokens if not fullmatch(t)]
+
+
+@cache
+def _compile_process_steps(
+    remove_stopwords: bool,
+    rejoin_suffixes: bool,
+    lowercase: bool,
+    strip_punct: bool,
+) -> tuple[Callable[[str], Any], tuple[TokenStep, ...]]:
+    """Resolve ``process_text`` options once per distinct combination."""
+    clean: Callable[[str], Any] = clean_text if lowercase else _clean_preserving_case
+    token_steps: list[TokenStep] = []
+    if strip_punct:
+        token_steps.append(_strip_punct_tokens)
+    if rejoin_suffixes:
+        token_steps.append(attach_detached_suffixes)
+    if remove_stopwords:
+        token_steps.append(remove_stopwords_fn)
+    return clean, tuple(token_steps)
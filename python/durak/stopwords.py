@@ -267,13 +267,22 @@ def remove_stopwords(
     """
     if tokens is None:
         return []
+    if manager is None and base is None and additions is None and keep is None:
+        # Default configuration: probe the shared frozenset directly instead of
+        # building a StopwordManager copy for every call.
+        if case_sensitive:
+            return [token for token in tokens if token not in BASE_STOPWORDS]
+        return [
+            token
+            for token in tokens
+            if normalize_case(token, mode="lower") not in BASE_STOPWORDS
+        ]
     if manager is None:
         resolved_case_sensitive = (
             case_sensitive if case_sensitive is not None else False
         )
-        resolved_base = base if base is not None else BASE_STOPWORDS
         manager = StopwordManager(
-            base=resolved_base,
+            base=base,
             additions=additions,
             keep=keep,
             case_sensitive=resolved_case_sensitive,
@@ -303,27 +312,21 @@ def _resolve_stopword_set(
     case_sensitive: bool,
 ) -> frozenset[str]:
     if resource is None:
-        if case_sensitive:
-            words = load_stopword_resource(
-                DEFAULT_STOPWORD_RESOURCE,
-                metadata_path=metadata_path,
-                case_sensitive=case_sensitive,
-            )
-            return frozenset(words)
-        return BASE_STOPWORDS
+        if not case_sensitive:
+            return BASE_STOPWORDS
+        resource = DEFAULT_STOPWORD_RESOURCE
 
     if isinstance(resource, str):
-        words = load_stopword_resource(
-            resource,
-            metadata_path=metadata_path,
-            case_sensitive=case_sensitive,
-        )
-    else:
-        words = load_stopword_resources(
-            resource,
-            metadata_path=metadata_path,
-            case_sensitive=case_sensitive,
-        )
+        # Single resources come straight from the loader cache, which already
+        # holds a frozenset, so lookups avoid copying the word set per call.
+        metadata = _resolve_metadata_path(metadata_path).resolve()
+        return _load_stopword_resource_cached(str(metadata), resource, case_sensitive)
+
+    words = load_stopword_resources(
+        resource,
+        metadata_path=metadata_path,
+        case_sensitive=case_sensitive,
+    )
     return frozenset(words)
 
 
@@ -420,11 +423,13 @@ class StopwordManager:
             case_sensitive: If True, stopword matching is case-sensitive. Defaults to False.
         """
         self.case_sensitive = case_sensitive
-        base_words = set(base) if base is not None else set(BASE_STOPWORDS)
-        normalized_base = {
-            _normalize(word, case_sensitive=case_sensitive) for word in base_words
-        }
-        self._stopwords: MutableSet[str] = set(normalized_base)
+        if base is None or base is BASE_STOPWORDS:
+            # BASE_STOPWORDS is already normalized; copy it once, skip re-folding.
+            self._stopwords: MutableSet[str] = set(BASE_STOPWORDS)
+        else:
+            self._stopwords = {
+                _normalize(word, case_sensitive=case_sensitive) for word in base
+            }
         self._keep_words: MutableSet[str] = set()
         if additions:
             self.add(additions)
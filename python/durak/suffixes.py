@@ -31,13 +31,16 @@ def _load_detached_suffixes() -> tuple[str, ...]:
 
 
 DEFAULT_DETACHED_SUFFIXES = _load_detached_suffixes()
+_DEFAULT_SUFFIX_SET: frozenset[str] = frozenset(
+    suffix.lower() for suffix in DEFAULT_DETACHED_SUFFIXES
+)
 
 
 def _has_alpha(token: str | None) -> bool:
     return bool(token) and any(char.isalpha() for char in (token or ""))
 
 
-def _matches_suffix(token: str | None, suffixes: set[str]) -> bool:
+def _matches_suffix(token: str | None, suffixes: frozenset[str]) -> bool:
     if not token:
         return False
     normalized = token.lower()
@@ -62,7 +65,10 @@ def attach_detached_suffixes(
     if not tokens:
         return []
 
-    suffix_set = {suffix.lower() for suffix in (suffixes or DEFAULT_DETACHED_SUFFIXES)}
+    if suffixes:
+        suffix_set = frozenset(suffix.lower() for suffix in suffixes)
+    else:
+        suffix_set = _DEFAULT_SUFFIX_SET
     if apostrophes is not None:
         apostrophe_set = tuple(apostrophes)
     else:
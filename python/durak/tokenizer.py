@@ -22,6 +22,8 @@ REGEX_TOKEN_PATTERN = re.compile(
     flags=re.UNICODE,
 )
 
+PUNCT_TOKEN_PATTERN = re.compile(PUNCT_TOKEN)
+
 SENTENCE_END_PATTERN = re.compile(r"([.!?…]+)(\s+|$)")
 ABBREVIATIONS = {
     "dr.",
@@ -52,8 +54,9 @@ def register_sentence_splitter(name: str, func: SentenceSplitter) -> None:
 
 def regex_tokenize(text: str) -> list[str]:
     """Tokenize text using regex patterns."""
-    matches = REGEX_TOKEN_PATTERN.findall(text)
-    return [match for match in matches if match.strip()]
+    # Every alternative consumes at least one non-whitespace character, so
+    # findall's list can be returned as-is without a filtering copy.
+    return REGEX_TOKEN_PATTERN.findall(text)
 
 
 def regex_sentence_split(text: str | None) -> list[str]:
@@ -108,7 +111,8 @@ def tokenize(
         raise TokenizationError(f"Unknown tokenizer strategy '{strategy}'.")
     tokens = tokenizer(text)
     if strip_punct:
-        tokens = [token for token in tokens if not re.fullmatch(PUNCT_TOKEN, token)]
+        fullmatch = PUNCT_TOKEN_PATTERN.fullmatch
+        tokens = [token for token in tokens if not fullmatch(token)]
     return tokens
 
 
@@ -141,12 +145,22 @@ try:
     from . import _durak_core
     tokenize_with_offsets = _durak_core.tokenize_with_offsets
     tokenize_with_normalized_offsets = _durak_core.tokenize_with_normalized_offsets
+    tokenize_with_normalized_offsets_batch = (
+        _durak_core.tokenize_with_normalized_offsets_batch
+    )
 except ImportError:
     def tokenize_with_normalized_offsets(text: str) -> list[tuple[str, int, int]]:
         raise RustExtensionError(
             "Rust extension not installed. Run: maturin develop"
         )
 
+    def tokenize_with_normalized_offsets_batch(
+        texts: list[str],
+    ) -> list[list[tuple[str, int, int]]]:
+        raise RustExtensionError(
+            "Rust extension not installed. Run: maturin develop"
+        )
+
 
 def normalize_tokens(
     tokens: Iterable[str],
@@ -155,8 +169,9 @@ def normalize_tokens(
     strip_punct: bool = False,
 ) -> list[str]:
     normalized: list[str] = []
+    fullmatch = PUNCT_TOKEN_PATTERN.fullmatch
     for token in tokens:
-        if strip_punct and re.fullmatch(PUNCT_TOKEN, token):
+        if strip_punct and fullmatch(token):
             continue
         normalized_token = normalize_case(token, mode="lower") if lower else token
         normalized.append(normalized_token)
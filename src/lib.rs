@@ -7,7 +7,7 @@ use regex::Regex;
 // will be keeping for backward compatability
 use serde::{Deserialize, Serialize};
 use root_validator::RootValidator;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::sync::OnceLock;
 
 
@@ -22,9 +22,15 @@ static RESOURCE_METADATA: &str = include_str!("../resources/metadata.json");
 static LEMMA_DICT_DATA: &str = include_str!("../resources/tr/lemmas/turkish_lemma_dict.txt");
 
 static LEMMA_DICT: OnceLock<HashMap<&'static str, &'static str>> = OnceLock::new();
+static KNOWN_LEMMAS: OnceLock<HashSet<&'static str>> = OnceLock::new();
 static TOKEN_REGEX: OnceLock<Regex> = OnceLock::new();
 static DETACHED_SUFFIXES: OnceLock<Vec<&'static str>> = OnceLock::new();
 static STOPWORDS_BASE: OnceLock<Vec<&'static str>> = OnceLock::new();
+static TURKISH_LOWER_TABLE: OnceLock<[char; TURKISH_LOWER_TABLE_LEN]> = OnceLock::new();
+
+// Code points below this bound (ASCII, Latin-1, Latin Extended-A/B) are folded
+// through TURKISH_LOWER_TABLE; that range covers every Turkish letter.
+const TURKISH_LOWER_TABLE_LEN: usize = 0x250;
 
 fn get_lemma_dict() -> &'static HashMap<&'static str, &'static str> {
     LEMMA_DICT.get_or_init(|| {
@@ -47,6 +53,12 @@ fn get_lemma_dict() -> &'static HashMap<&'static str, &'static str> {
     })
 }
 
+/// Set of every lemma (value) in the dictionary, so reverse lookups are a
+/// single hash probe instead of a scan over all entries
+fn get_known_lemmas() -> &'static HashSet<&'static str> {
+    KNOWN_LEMMAS.get_or_init(|| get_lemma_dict().values().copied().collect())
+}
+
 /// Check if a word is a known lemma (root form) in the dictionary
 fn is_known_lemma(word: &str) -> bool {
     let dict = get_lemma_dict();
@@ -59,7 +71,42 @@ fn is_known_lemma(word: &str) -> bool {
     }
 
     // Also check if any entry has this as its lemma
-    dict.values().any(|&lemma| lemma == word)
+    get_known_lemmas().contains(word)
+}
+
+/// Apply the Turkish I/İ mapping and/or lowercasing to a single character.
+fn normalize_char(c: char, lowercase: bool, handle_turkish_i: bool) -> char {
+    // First, handle Turkish I/İ conversion if enabled
+    let c = if handle_turkish_i {
+        match c {
+            'İ' => 'i',
+            'I' => 'ı',
+            _ => c
+        }
+    } else {
+        c
+    };
+
+    // Then, apply lowercasing if enabled
+    if lowercase {
+        c.to_lowercase().next().unwrap_or(c)
+    } else {
+        c
+    }
+}
+
+fn get_turkish_lower_table() -> &'static [char; TURKISH_LOWER_TABLE_LEN] {
+    TURKISH_LOWER_TABLE.get_or_init(|| {
+        // Precompute the default (lowercase + Turkish I) mapping so the hot
+        // loop is a single indexed load for Latin text
+        let mut table = ['\0'; TURKISH_LOWER_TABLE_LEN];
+        for (code, slot) in table.iter_mut().enumerate() {
+            // No surrogates below 0x250, so every index is a valid char
+            let c = char::from_u32(code as u32).unwrap();
+            *slot = normalize_char(c, true, true);
+        }
+        table
+    })
 }
 
 fn get_token_regex() -> &'static Regex {
@@ -78,6 +125,10 @@ fn get_token_regex() -> &'static Regex {
     })
 }
 
+/// Inputs at least this many bytes long are normalized with the GIL released;
+/// below it, releasing and reacquiring the GIL costs more than the work.
+const DETACH_MIN_LEN: usize = 4096;
+
 /// Fast normalization for Turkish text.
 /// Handles I/ı and İ/i conversion correctly and optionally lowercases the rest.
 /// 
@@ -86,60 +137,158 @@ fn get_token_regex() -> &'static Regex {
 /// * `lowercase` - If true, convert text to lowercase
 /// * `handle_turkish_i` - If true, handle Turkish İ/I conversion (İ→i, I→ı)
 #[pyfunction]
-fn fast_normalize(text: &str, lowercase: bool, handle_turkish_i: bool) -> String {
-    // Rust handles Turkish I/ı conversion correctly and instantly
-    // "Single Pass" allocation for maximum speed
-    text.chars().map(|c| {
-        // First, handle Turkish I/İ conversion if enabled
-        let c = if handle_turkish_i {
-            match c {
-                'İ' => 'i',
-                'I' => 'ı',
-                _ => c
-            }
+#[pyo3(signature = (text, lowercase=true, handle_turkish_i=true))]
+fn fast_normalize<'py>(
+    py: Python<'py>,
+    text: &Bound<'py, pyo3::types::PyString>,
+    lowercase: bool,
+    handle_turkish_i: bool,
+) -> PyResult<Bound<'py, pyo3::types::PyString>> {
+    // Borrows the str's UTF-8 buffer, no copy
+    let input = text.to_str()?;
+
+    // ASCII text the transform would leave unchanged is handed back as the
+    // same Python object: no output buffer and no copy into a new str
+    let unchanged = input.is_ascii()
+        && !input
+            .bytes()
+            .any(|b| (lowercase && b.is_ascii_uppercase()) || (handle_turkish_i && b == b'I'));
+    if unchanged {
+        return Ok(text.clone());
+    }
+
+    // Long inputs release the GIL so other Python threads can run meanwhile
+    let normalized = if input.len() >= DETACH_MIN_LEN {
+        py.detach(|| normalize_text(input, lowercase, handle_turkish_i))
+    } else {
+        normalize_text(input, lowercase, handle_turkish_i)
+    };
+    Ok(pyo3::types::PyString::new(py, &normalized))
+}
+
+/// GIL-independent body of `fast_normalize`.
+fn normalize_text(text: &str, lowercase: bool, handle_turkish_i: bool) -> String {
+    // ASCII input needs no Turkish folding unless it contains 'I', so it can
+    // be lowercased bytewise without decoding chars
+    if text.is_ascii() && !(handle_turkish_i && text.contains('I')) {
+        return if lowercase {
+            text.to_ascii_lowercase()
         } else {
-            c
+            text.to_owned()
         };
-        
-        // Then, apply lowercasing if enabled
-        if lowercase {
-            c.to_lowercase().next().unwrap_or(c)
-        } else {
-            c
+    }
+
+    // Rust handles Turkish I/ı conversion correctly and instantly
+    // "Single Pass" allocation for maximum speed: reserve the input length up
+    // front (Turkish case pairs mostly keep their UTF-8 width)
+    let mut out = String::with_capacity(text.len());
+    if lowercase && handle_turkish_i {
+        let table = get_turkish_lower_table();
+        let bytes = text.as_bytes();
+        let mut i = 0;
+        while i < bytes.len() {
+            let b = bytes[i];
+            if b.is_ascii() && b != b'I' {
+                // Runs of plain ASCII (most of any Turkish text) are copied in
+                // one go and lowercased in place; that loop has no per-char
+                // branches and vectorizes, unlike a char-by-char table walk
+                let run_end = bytes[i..]
+                    .iter()
+                    .position(|&b| !b.is_ascii() || b == b'I')
+                    .map_or(bytes.len(), |n| i + n);
+                let start = out.len();
+                out.push_str(&text[i..run_end]);
+                out[start..].make_ascii_lowercase();
+                i = run_end;
+                continue;
+            }
+            if b.is_ascii() {
+                // Only 'I' gets here; it folds to dotless 'ı'
+                out.push(table[b as usize]);
+                i += 1;
+                continue;
+            }
+
+            // Only non-ASCII lead bytes pay for decoding a char
+            let c = text[i..].chars().next().unwrap();
+            let code = c as usize;
+            out.push(if code < TURKISH_LOWER_TABLE_LEN {
+                table[code]
+            } else {
+                normalize_char(c, true, true)
+            });
+            i += c.len_utf8();
         }
-    }).collect()
+    } else {
+        out.extend(
+            text.chars()
+                .map(|c| normalize_char(c, lowercase, handle_turkish_i)),
+        );
+    }
+    out
+}
+
+/// Normalize a batch of texts in a single call.
+/// Pays the Python→Rust crossing once for the whole list and releases the GIL
+/// while the texts are normalized.
+#[pyfunction]
+#[pyo3(signature = (texts, lowercase=true, handle_turkish_i=true))]
+fn fast_normalize_batch(
+    py: Python,
+    texts: Vec<String>,
+    lowercase: bool,
+    handle_turkish_i: bool,
+) -> Vec<String> {
+    py.detach(|| {
+        texts
+            .iter()
+            .map(|text| normalize_text(text, lowercase, handle_turkish_i))
+            .collect()
+    })
+}
+
+/// Converts regex byte offsets into Python character offsets.
+///
+/// Matches arrive in increasing order, so only the text since the previous
+/// match is counted and the whole conversion stays linear in the input
+/// instead of rescanning from the start for every token.
+#[derive(Default)]
+struct CharOffsets {
+    byte_pos: usize,
+    char_pos: usize,
+}
+
+impl CharOffsets {
+    fn convert(&mut self, text: &str, byte_start: usize, byte_end: usize) -> (usize, usize) {
+        let char_start = self.char_pos + text[self.byte_pos..byte_start].chars().count();
+        let char_end = char_start + text[byte_start..byte_end].chars().count();
+        self.byte_pos = byte_end;
+        self.char_pos = char_end;
+        (char_start, char_end)
+    }
 }
 
 /// Tokenize text and return tokens with their start and end character offsets.
 /// Returns a list of (token, start, end).
 #[pyfunction]
-fn tokenize_with_offsets(text: &str) -> Vec<(String, usize, usize)> {
+fn tokenize_with_offsets(
+    py: Python,
+    text: &str,
+) -> Vec<(Py<pyo3::types::PyString>, usize, usize)> {
     let re = get_token_regex();
     let mut results = Vec::new();
+    // Repeated tokens share one Python string object instead of each
+    // allocating its own copy (scoped to this call, so it never grows stale)
+    let mut interned: HashMap<&str, Py<pyo3::types::PyString>> = HashMap::new();
+    let mut offsets = CharOffsets::default();
 
     for caps in re.captures_iter(text) {
         if let Some(mat) = caps.get(0) {
-            let token = mat.as_str().to_string();
-            // In Rust regex, `mat.start()` and `mat.end()` return byte indices.
-            // Python expects character indices. We must convert carefully.
-            // However, typical NLP tools often work with byte offsets or char offsets.
-            // Here we want char offsets strictly for Python compatibility if possible,
-            // OR we just return byte offsets and let Python handle it?
-            // "The Fix: Your Rust tokenizer must return Offset Mappings (start/end indices pointing back to the original raw text)"
-            // Usually Python users expect char indices.
-
-            // Converting byte offset to char offset is O(N) scan unless we map it.
-            // For now, let's just return what Regex gives us, which is byte offsets,
-            // BUT for this PoC we can do a quick char count up to that point if we want absolute correctness,
-            // or just note that these are byte offsets (Rust UTF-8).
-            // Let's implement char offset conversion for correctness.
-            let byte_start = mat.start();
-            let byte_end = mat.end();
-
-            let char_start = text[..byte_start].chars().count();
-            let char_len = text[byte_start..byte_end].chars().count();
-            let char_end = char_start + char_len;
-
+            let token = interned
+                .entry(mat.as_str())
+                .or_insert_with(|| pyo3::types::PyString::new(py, mat.as_str()).unbind())
+                .clone_ref(py);
+            let (char_start, char_end) = offsets.convert(text, mat.start(), mat.end());
             results.push((token, char_start, char_end));
         }
     }
@@ -158,21 +307,30 @@ fn tokenize_with_offsets(text: &str) -> Vec<(String, usize, usize)> {
 /// ```
 #[pyfunction]
 fn tokenize_with_normalized_offsets(text: &str) -> Vec<(String, usize, usize)> {
+    normalized_offsets(text)
+}
+
+/// Normalized-offset tokenization over a batch of texts, in a single
+/// Python→Rust crossing. The GIL is released while the texts are tokenized.
+#[pyfunction]
+fn tokenize_with_normalized_offsets_batch(
+    py: Python,
+    texts: Vec<String>,
+) -> Vec<Vec<(String, usize, usize)>> {
+    py.detach(|| texts.iter().map(|text| normalized_offsets(text)).collect())
+}
+
+fn normalized_offsets(text: &str) -> Vec<(String, usize, usize)> {
     let re = get_token_regex();
     let mut results = Vec::new();
+    let mut offsets = CharOffsets::default();
 
     for caps in re.captures_iter(text) {
         if let Some(mat) = caps.get(0) {
             let token = mat.as_str();
-            let normalized_token = fast_normalize(token);
-            
-            let byte_start = mat.start();
-            let byte_end = mat.end();
-            
-            let char_start = text[..byte_start].chars().count();
-            let char_len = text[byte_start..byte_end].chars().count();
-            let char_end = char_start + char_len;
-            
+            let normalized_token = normalize_text(token, true, true);
+            let (char_start, char_end) = offsets.convert(text, mat.start(), mat.end());
+
             results.push((normalized_token, char_start, char_end));
         }
     }
@@ -186,6 +344,19 @@ fn lookup_lemma(word: &str) -> Option<String> {
     dict.get(word).map(|s| s.to_string())
 }
 
+/// Tier 1 over a batch of words, in a single Python→Rust crossing.
+/// The GIL is released while the batch is looked up.
+#[pyfunction]
+fn lookup_lemma_batch(py: Python, words: Vec<String>) -> Vec<Option<String>> {
+    let dict = get_lemma_dict();
+    py.detach(|| {
+        words
+            .iter()
+            .map(|word| dict.get(word.as_str()).map(|s| s.to_string()))
+            .collect()
+    })
+}
+
 /// Turkish suffix categories for morphological analysis
 ///
 /// Turkish is an agglutinative language with complex suffix chains.
@@ -296,37 +467,99 @@ mod suffixes {
     ];
 }
 
+/// Trie over reversed suffix strings: one backwards walk over a word visits
+/// every known suffix the word ends with, shortest first.
+#[derive(Default)]
+struct SuffixTrie {
+    children: HashMap<char, SuffixTrie>,
+    terminal: bool,
+}
+
+impl SuffixTrie {
+    fn insert(&mut self, suffix: &str) {
+        let mut node = self;
+        for c in suffix.chars().rev() {
+            node = node.children.entry(c).or_default();
+        }
+        node.terminal = true;
+    }
+
+    /// Byte length of the longest suffix of `word` in the trie that is at
+    /// most `max_chars` characters long.
+    fn longest_match(&self, word: &str, max_chars: usize) -> Option<usize> {
+        let mut node = self;
+        let mut byte_len = 0;
+        let mut best = None;
+
+        for c in word.chars().rev().take(max_chars) {
+            node = match node.children.get(&c) {
+                Some(next) => next,
+                None => break,
+            };
+            byte_len += c.len_utf8();
+            if node.terminal {
+                best = Some(byte_len);
+            }
+        }
+        best
+    }
+}
+
+static SUFFIX_TRIE: OnceLock<SuffixTrie> = OnceLock::new();
+
+fn get_suffix_trie() -> &'static SuffixTrie {
+    SUFFIX_TRIE.get_or_init(|| {
+        let mut trie = SuffixTrie::default();
+        for suffix in suffixes::COMPOUND_SUFFIXES
+            .iter()
+            .chain(suffixes::NOMINAL_SUFFIXES.iter())
+            .chain(suffixes::VERBAL_SUFFIXES.iter())
+        {
+            trie.insert(suffix);
+        }
+        trie
+    })
+}
+
 /// Tier 2: Heuristic Suffix Stripping
 /// Simple rule-based stripper for demonstration.
 /// In production, this would use a more complex state machine and vowel harmony checks.
 #[pyfunction]
 fn strip_suffixes(word: &str) -> String {
-    let mut current = word.to_string();
-
-    // Use compound suffixes first (longest match)
-    let all_suffixes: Vec<&str> = suffixes::COMPOUND_SUFFIXES
-        .iter()
-        .chain(suffixes::NOMINAL_SUFFIXES.iter())
-        .chain(suffixes::VERBAL_SUFFIXES.iter())
-        .cloned()
-        .collect();
-
-    let mut changed = true;
-    while changed {
-        changed = false;
-        // Sort by length descending for greedy matching
-        let mut sorted: Vec<&&str> = all_suffixes.iter().collect();
-        sorted.sort_by(|a, b| b.len().cmp(&a.len()));
-
-        for suffix in sorted {
-            if current.ends_with(suffix) && current.chars().count() > suffix.chars().count() + 2 {
-                current = current[..current.len() - suffix.len()].to_string();
-                changed = true;
-                break;
-            }
+    let trie = get_suffix_trie();
+    let mut current = word;
+
+    // Greedily strip the longest matching suffix (all matches are suffixes of
+    // the same word, so longest in bytes == longest in chars) as long as
+    // more than 2 characters of root remain
+    loop {
+        let char_count = current.chars().count();
+        if char_count < 3 {
+            break;
+        }
+        match trie.longest_match(current, char_count - 3) {
+            Some(suffix_len) => current = &current[..current.len() - suffix_len],
+            None => break,
         }
     }
-    current
+    current.to_string()
+}
+
+/// Tier 1 with Tier 2 fallback in one call: dictionary lookup first, then
+/// heuristic suffix stripping on a miss, without a second crossing.
+#[pyfunction]
+fn lemmatize_hybrid(word: &str) -> String {
+    match get_lemma_dict().get(word) {
+        Some(lemma) => lemma.to_string(),
+        None => strip_suffixes(word),
+    }
+}
+
+/// Tier 2 over a batch of words, in a single Python→Rust crossing.
+/// The GIL is released while the batch is stripped.
+#[pyfunction]
+fn strip_suffixes_batch(py: Python, words: Vec<String>) -> Vec<String> {
+    py.detach(|| words.iter().map(|word| strip_suffixes(word)).collect())
 }
 
 /// Strip suffixes with root validity checking, vowel harmony, and morphotactic validation
@@ -392,6 +625,7 @@ fn strip_suffixes_validated(
 
     // Get dictionary reference for checking known words
     // We check if candidates are known lemmas (root forms)
+    let dictionary = get_known_lemmas();
 
     let mut changed = true;
     let mut iterations = 0;
@@ -606,12 +840,17 @@ fn get_resource_info(py: Python) -> PyResult<HashMap<String, Py<pyo3::types::PyA
 fn _durak_core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Core text processing functions
     m.add_function(wrap_pyfunction!(fast_normalize, m)?)?;
+    m.add_function(wrap_pyfunction!(fast_normalize_batch, m)?)?;
     m.add_function(wrap_pyfunction!(tokenize_with_offsets, m)?)?;
     m.add_function(wrap_pyfunction!(tokenize_with_normalized_offsets, m)?)?;
+    m.add_function(wrap_pyfunction!(tokenize_with_normalized_offsets_batch, m)?)?;
 
     // Lemmatization functions
     m.add_function(wrap_pyfunction!(lookup_lemma, m)?)?;
+    m.add_function(wrap_pyfunction!(lookup_lemma_batch, m)?)?;
     m.add_function(wrap_pyfunction!(strip_suffixes, m)?)?;
+    m.add_function(wrap_pyfunction!(strip_suffixes_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(lemmatize_hybrid, m)?)?;
     m.add_function(wrap_pyfunction!(strip_suffixes_validated, m)?)?;
 
     // Vowel harmony checker
@@ -638,6 +877,25 @@ fn _durak_core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_normalize_text_mixed_ascii_runs() {
+        assert_eq!(
+            normalize_text("İSTANBUL'DA Işık ABC", true, true),
+            "istanbul'da ışık abc"
+        );
+        assert_eq!(normalize_text("IĞDIR", true, true), "ığdır");
+    }
+
+    #[test]
+    fn test_char_offsets_are_incremental() {
+        let text = "İstanbul'a çok güzel";
+        let mut offsets = CharOffsets::default();
+        let first_end = "İstanbul'a".len();
+        assert_eq!(offsets.convert(text, 0, first_end), (0, 10));
+        let start = text.find("güzel").unwrap();
+        assert_eq!(offsets.convert(text, start, text.len()), (15, 20));
+    }
+
     #[test]
     fn test_lemma_dict_loading() {
         let dict = get_lemma_dict();
@@ -38,12 +38,21 @@ impl VowelClass {
 /// Get the vowel class of a character
 /// Returns None if the character is not a Turkish vowel
 pub fn get_vowel_class(c: char) -> Option<VowelClass> {
-    match c.to_lowercase().next()? {
+    // Lowercase input (the common case in suffixes and normalized roots) is
+    // classified directly; only other characters pay for to_lowercase()
+    match c {
         'e' | 'i' => Some(VowelClass::FrontUnrounded),
         'ö' | 'ü' => Some(VowelClass::FrontRounded),
         'a' | 'ı' => Some(VowelClass::BackUnrounded),
         'o' | 'u' => Some(VowelClass::BackRounded),
-        _ => None,
+        c if c.is_ascii_lowercase() => None,
+        _ => match c.to_lowercase().next()? {
+            'e' | 'i' => Some(VowelClass::FrontUnrounded),
+            'ö' | 'ü' => Some(VowelClass::FrontRounded),
+            'a' | 'ı' => Some(VowelClass::BackUnrounded),
+            'o' | 'u' => Some(VowelClass::BackRounded),
+            _ => None,
+        },
     }
 }
 
@@ -101,16 +110,13 @@ pub fn check_vowel_harmony(root: &str, suffix: &str) -> bool {
         None => return false, // No vowels in root = cannot validate
     };
 
-    // Check all vowels in the suffix
-    let suffix_vowels: Vec<VowelClass> = suffix.chars().filter_map(get_vowel_class).collect();
-
-    // Empty suffix or suffix with no vowels = always valid
-    if suffix_vowels.is_empty() {
-        return true;
-    }
-
-    // All suffix vowels must harmonize with the root vowel
-    suffix_vowels.iter().all(|&v| check_harmony(root_vowel, v))
+    // All suffix vowels must harmonize with the root vowel; scanning lazily
+    // avoids collecting them and stops at the first violation.
+    // Empty suffix or suffix with no vowels = always valid (all() of nothing)
+    suffix
+        .chars()
+        .filter_map(get_vowel_class)
+        .all(|v| check_harmony(root_vowel, v))
 }
 
 #[cfg(test)]
@@ -7,6 +7,12 @@ def test_normalize_unicode_handles_typographic_variants() -> None:
     assert cleaning.normalize_unicode(raw) == '"İstanbul\'da-efsane!"'
 
 
+def test_normalize_unicode_composes_decomposed_text() -> None:
+    decomposed = "güzel şehir"
+    assert cleaning.normalize_unicode(decomposed) == "güzel şehir"
+    assert cleaning.normalize_unicode("güzel şehir") == "güzel şehir"
+
+
 def test_strip_html_removes_tags_and_scripts() -> None:
     html_text = "<p>Merhaba <strong>dünya</strong></p><script>alert('x')</script>"
     assert cleaning.strip_html(html_text) == "Merhaba dünya"
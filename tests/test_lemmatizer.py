@@ -1,25 +1,28 @@
 import pytest
 from durak.lemmatizer import Lemmatizer
 
+try:
+    from durak import _durak_core  # noqa: F401
 
+    RUST_AVAILABLE = True
+except ImportError:
+    RUST_AVAILABLE = False
+
+requires_rust = pytest.mark.skipif(
+    not RUST_AVAILABLE, reason="Rust extension not installed"
+)
+
+
+@requires_rust
 def test_tier1_lookup():
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     lemmatizer = Lemmatizer(strategy="lookup")
     # "kitaplar" is in our mock dict -> "kitap"
     assert lemmatizer("kitaplar") == "kitap"
     # "unknownword" -> returns as-is in lookup mode
     assert lemmatizer("unknownword") == "unknownword"
 
+@requires_rust
 def test_tier2_heuristic():
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-
     lemmatizer = Lemmatizer(strategy="heuristic")
     # "masalar" -> "masa" (removes -lar)
     assert lemmatizer("masalar") == "masa"
@@ -27,12 +30,8 @@ def test_tier2_heuristic():
     # With current naive implementation: gelmeden -> gelme
     assert lemmatizer("gelmeden").startswith("gel")
 
+@requires_rust
 def test_hybrid_priority():
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     lemmatizer = Lemmatizer(strategy="hybrid")
     # "gittim" is in dict -> "git"
     assert lemmatizer("gittim") == "git"
@@ -40,12 +39,8 @@ def test_hybrid_priority():
     # "arabalar" not in dict -> heuristic "araba"
     assert lemmatizer("arabalar") == "araba"
 
+@requires_rust
 def test_protection_rule():
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-
     # Heuristic shouldn't strip too much
     # "kiler" ends with "ler" but "ki" is too short (<=2 chars + suffix len?)
     # implementation has > suffix.len() + 2
@@ -55,13 +50,9 @@ def test_protection_rule():
     assert lemmatizer("kiler") == "kiler"
 
 
+@requires_rust
 def test_comprehensive_dictionary_nouns():
     """Test comprehensive dictionary with common Turkish nouns"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="lookup")
     
     # Test plural forms
@@ -82,13 +73,9 @@ def test_comprehensive_dictionary_nouns():
     assert lemmatizer("evimiz") == "ev"
 
 
+@requires_rust
 def test_comprehensive_dictionary_verbs():
     """Test comprehensive dictionary with common Turkish verbs"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="lookup")
     
     # Test present tense conjugations
@@ -116,13 +103,9 @@ def test_comprehensive_dictionary_verbs():
     assert lemmatizer("görüyorum") == "gör"
 
 
+@requires_rust
 def test_comprehensive_dictionary_pronouns():
     """Test comprehensive dictionary with Turkish pronouns"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="lookup")
     
     # Test personal pronouns with case markers
@@ -148,13 +131,9 @@ def test_comprehensive_dictionary_pronouns():
     assert lemmatizer("şunlar") == "şu"
 
 
+@requires_rust
 def test_dictionary_coverage():
     """Verify dictionary has significantly more entries than mock data"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="lookup")
     
     # Count successful lookups from a diverse sample
@@ -174,13 +153,9 @@ def test_dictionary_coverage():
     assert successful_lookups >= len(test_words) * 0.8
 
 
+@requires_rust
 def test_hybrid_with_comprehensive_dict():
     """Test hybrid strategy prioritizes comprehensive dictionary"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="hybrid")
     
     # Words in dictionary should use lookup
@@ -195,13 +170,9 @@ def test_hybrid_with_comprehensive_dict():
     assert result == "araba"
 
 
+@requires_rust
 def test_root_validation_lenient():
     """Test root validation in lenient mode (phonotactic checks only)"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(
         strategy="heuristic",
         validate_roots=True,
@@ -220,13 +191,9 @@ def test_root_validation_lenient():
     assert len(result) >= 2
 
 
+@requires_rust
 def test_root_validation_strict():
     """Test root validation in strict mode (dictionary checking)"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(
         strategy="heuristic",
         validate_roots=True,
@@ -245,13 +212,9 @@ def test_root_validation_strict():
     # In strict mode, should be conservative
 
 
+@requires_rust
 def test_root_validation_custom_min_length():
     """Test root validation with custom minimum length"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     # Require at least 3 characters
     lemmatizer = Lemmatizer(
         strategy="heuristic",
@@ -269,13 +232,9 @@ def test_root_validation_custom_min_length():
     assert result == "kitap"  # 5 chars, ok
 
 
+@requires_rust
 def test_root_validation_hybrid():
     """Test root validation works with hybrid strategy"""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(
         strategy="hybrid",
         validate_roots=True,
@@ -290,6 +249,57 @@ def test_root_validation_hybrid():
     assert result == "araba"
 
 
+@requires_rust
+def test_lemmatize_many_matches_single_calls():
+    """Test batch lemmatization agrees with per-word calls"""
+    words = ["kitaplar", "arabalar", "", "gittim", "unknownword"]
+    for strategy in ("lookup", "heuristic", "hybrid"):
+        lemmatizer = Lemmatizer(strategy=strategy)
+        assert lemmatizer.lemmatize_many(words) == [lemmatizer(w) for w in words]
+        assert lemmatizer.lemmatize_many([]) == []
+
+
+def test_lemmatize_many_rejects_non_strings():
+    """Test batch lemmatization validates every input"""
+    from durak.exceptions import LemmatizerError
+
+    lemmatizer = Lemmatizer(strategy="lookup")
+    with pytest.raises(LemmatizerError):
+        lemmatizer.lemmatize_many(["kitaplar", 42])
+
+
+@requires_rust
+def test_lemmatizer_cache_returns_same_results():
+    """Test opt-in memoization does not change results"""
+    plain = Lemmatizer(strategy="hybrid")
+    cached = Lemmatizer(strategy="hybrid", cache_size=16)
+    words = ["kitaplar", "arabalar", "kitaplar", "gittim", "arabalar"]
+
+    assert [cached(w) for w in words] == [plain(w) for w in words]
+    assert cached.lemmatize_many(words) == plain.lemmatize_many(words)
+    info = cached.cache_info()
+    assert info.misses == 3
+    assert info.hits == len(words) * 2 - 3
+    cached.clear_cache()
+    assert cached.cache_info().currsize == 0
+    assert cached("kitaplar") == "kitap"
+
+
+def test_lemmatizer_cache_configuration():
+    """Test cache_size validation and clear_cache without a cache"""
+    from durak.exceptions import ConfigurationError
+
+    with pytest.raises(ConfigurationError):
+        Lemmatizer(cache_size=-1)
+    with pytest.raises(ConfigurationError):
+        Lemmatizer().clear_cache()
+    with pytest.raises(ConfigurationError):
+        Lemmatizer().cache_info()
+    assert repr(Lemmatizer(strategy="lookup", cache_size=128)) == (
+        "Lemmatizer(strategy='lookup', cache_size=128)"
+    )
+
+
 def test_lemmatizer_repr_with_validation():
     """Test __repr__ includes validation parameters"""
     lemmatizer = Lemmatizer(
@@ -300,10 +310,10 @@ def test_lemmatizer_repr_with_validation():
     )
     
     repr_str = repr(lemmatizer)
-    assert "strategy='hybrid'" in repr_str
-    assert "validate_roots=True" in repr_str
-    assert "strict_validation=True" in repr_str
-    assert "min_root_length=3" in repr_str
+    assert repr_str == (
+        "Lemmatizer(strategy='hybrid', validate_roots=True, "
+        "strict_validation=True, min_root_length=3)"
+    )
 
 
 def test_lemmatizer_repr_without_validation():
@@ -312,3 +322,40 @@ def test_lemmatizer_repr_without_validation():
     
     repr_str = repr(lemmatizer)
     assert repr_str == "Lemmatizer(strategy='lookup')"
+
+
+def test_lemmatizer_configuration_is_read_only():
+    """Test configuration cannot drift from the resolved lemmatization path"""
+    lemmatizer = Lemmatizer(strategy="lookup")
+    for name, value in [
+        ("strategy", "heuristic"),
+        ("validate_roots", True),
+        ("strict_validation", True),
+        ("min_root_length", 4),
+        ("collect_metrics", True),
+        ("cache_size", 8),
+    ]:
+        with pytest.raises(AttributeError):
+            setattr(lemmatizer, name, value)
+    assert repr(lemmatizer) == "Lemmatizer(strategy='lookup')"
+
+
+@requires_rust
+def test_lemmatizer_pickle_and_copy_with_cache():
+    """Test cached lemmatizers survive pickling and copies count their own calls"""
+    import copy
+    import pickle
+
+    lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True, cache_size=16)
+    assert lemmatizer("kitaplar") == "kitap"
+
+    restored = pickle.loads(pickle.dumps(lemmatizer))
+    assert repr(restored) == repr(lemmatizer)
+    assert restored("kitaplar") == "kitap"
+    assert restored.get_metrics().total_calls == 2
+
+    copied = copy.deepcopy(lemmatizer)
+    assert copied("arabalar") == "araba"
+    assert copied.cache_info().currsize == 1
+    assert copied.get_metrics().total_calls == 2
+    assert lemmatizer.get_metrics().total_calls == 1
@@ -1,9 +1,22 @@
 """Tests for LemmatizerMetrics performance tracking."""
 
+import time
+
 import pytest
 from durak.exceptions import ConfigurationError
 from durak.lemmatizer import Lemmatizer, LemmatizerMetrics
 
+try:
+    from durak import _durak_core  # noqa: F401
+
+    RUST_AVAILABLE = True
+except ImportError:
+    RUST_AVAILABLE = False
+
+requires_rust = pytest.mark.skipif(
+    not RUST_AVAILABLE, reason="Rust extension not installed"
+)
+
 
 def test_metrics_disabled_by_default():
     """Metrics should be disabled by default (zero overhead)."""
@@ -23,13 +36,9 @@ def test_metrics_raises_when_disabled():
         lemmatizer.reset_metrics()
 
 
+@requires_rust
 def test_metrics_basic_tracking():
     """Test basic metrics collection for lookup hits."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="lookup", collect_metrics=True)
     
     # Initial state
@@ -48,13 +57,23 @@ def test_metrics_basic_tracking():
     assert metrics.heuristic_calls == 0
 
 
+@requires_rust
+def test_metrics_snapshot_is_independent():
+    """get_metrics() should return a snapshot, not the live counters."""
+    lemmatizer = Lemmatizer(strategy="lookup", collect_metrics=True)
+    lemmatizer("kitaplar")
+    snapshot = lemmatizer.get_metrics()
+
+    lemmatizer("unknownxyzword")
+
+    assert snapshot.total_calls == 1
+    assert snapshot.cache_hit_rate == 1.0
+    assert lemmatizer.get_metrics().total_calls == 2
+
+
+@requires_rust
 def test_metrics_lookup_miss():
     """Test metrics track lookup misses correctly."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="lookup", collect_metrics=True)
     
     # Process unknown word (not in dictionary)
@@ -67,13 +86,9 @@ def test_metrics_lookup_miss():
     assert metrics.heuristic_calls == 0
 
 
+@requires_rust
 def test_metrics_heuristic_strategy():
     """Test metrics for heuristic-only strategy."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="heuristic", collect_metrics=True)
     
     # Process words (should use heuristic)
@@ -86,13 +101,9 @@ def test_metrics_heuristic_strategy():
     assert metrics.lookup_hits == 0  # Lookup not used in heuristic mode
 
 
+@requires_rust
 def test_metrics_hybrid_fallback():
     """Test metrics track hybrid strategy fallback correctly."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True)
     
     # Known word (should hit dictionary)
@@ -109,13 +120,9 @@ def test_metrics_hybrid_fallback():
     assert metrics.heuristic_calls == 1  # Second word used heuristic
 
 
+@requires_rust
 def test_metrics_cache_hit_rate():
     """Test cache hit rate calculation."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True)
     
     # Process mix of known and unknown words
@@ -129,13 +136,28 @@ def test_metrics_cache_hit_rate():
     assert metrics.cache_hit_rate == pytest.approx(0.6, rel=0.01)
 
 
+@requires_rust
+def test_metrics_count_cached_calls():
+    """Calls answered from the lemma cache still update the counters."""
+    lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True, cache_size=8)
+
+    words = ["kitaplar", "unknownword1", "kitaplar", "unknownword1", "kitaplar"]
+    for word in words:
+        lemmatizer(word)
+
+    metrics = lemmatizer.get_metrics()
+    assert metrics.total_calls == 5
+    assert metrics.lookup_hits == 3
+    assert metrics.lookup_misses == 2
+    assert metrics.heuristic_calls == 2
+    assert metrics.cache_hit_rate == pytest.approx(0.6, rel=0.01)
+    info = lemmatizer.cache_info()
+    assert (info.hits, info.misses) == (3, 2)
+
+
+@requires_rust
 def test_metrics_timing():
     """Test that timing metrics are collected."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True)
     
     # Process words - mix of lookup hits and heuristic fallbacks
@@ -155,13 +177,9 @@ def test_metrics_timing():
     assert metrics.avg_call_time_ms < 10  # Sanity check
 
 
+@requires_rust
 def test_metrics_reset():
     """Test metrics reset functionality."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True)
     
     # Process some words
@@ -180,13 +198,9 @@ def test_metrics_reset():
     assert metrics.total_time == 0.0
 
 
+@requires_rust
 def test_metrics_to_dict():
     """Test metrics export to dictionary."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True)
     
     # Process words
@@ -213,13 +227,9 @@ def test_metrics_to_dict():
     assert metrics_dict["heuristic_calls"] == 1
 
 
+@requires_rust
 def test_metrics_str_format():
     """Test metrics string formatting."""
-    try:
-        from durak import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True)
     
     # Process words
@@ -253,17 +263,12 @@ def test_metrics_repr():
     lemmatizer = Lemmatizer(strategy="hybrid", collect_metrics=True)
     
     repr_str = repr(lemmatizer)
-    assert "collect_metrics=True" in repr_str
+    assert repr_str == "Lemmatizer(strategy='hybrid', collect_metrics=True)"
 
 
+@requires_rust
 def test_metrics_no_overhead_when_disabled():
     """Verify metrics=False has minimal overhead."""
-    try:
-        from durak import _durak_core  # noqa: F401
-        import time
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-    
     # Benchmark without metrics
     lemmatizer_fast = Lemmatizer(strategy="hybrid", collect_metrics=False)
     start = time.perf_counter()
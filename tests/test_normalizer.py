@@ -97,6 +97,37 @@ def test_bug_lowercase_flags_ignored_by_backend() -> None:
         mock_fast.assert_called()
 
 
+def test_normalize_many_uses_batch_backend() -> None:
+    """Test that normalize_many forwards the whole batch and flags in one call."""
+
+    normalizer = Normalizer(lowercase=True, handle_turkish_i=False)
+
+    with patch("durak.normalizer.fast_normalize_batch") as mock_batch:
+        mock_batch.side_effect = lambda texts, *args: [t.lower() for t in texts]
+        assert normalizer.normalize_many(["ANKARA", "Dünya"]) == ["ankara", "dünya"]
+        mock_batch.assert_called_once_with(["ANKARA", "Dünya"], True, False)
+
+
+def test_normalize_many_rejects_non_strings(normalizer) -> None:
+    """Test that normalize_many validates every input before calling backend."""
+
+    with patch("durak.normalizer.fast_normalize_batch") as mock_batch:
+        with pytest.raises(NormalizerError, match="Input must be a string"):
+            normalizer.normalize_many(["ankara", None])
+        assert normalizer.normalize_many([]) == []
+        mock_batch.assert_not_called()
+
+
+def test_all_flags_disabled_skips_backend() -> None:
+    """Test that a Normalizer with no transforms returns input unchanged."""
+
+    normalizer = Normalizer(lowercase=False, handle_turkish_i=False)
+
+    with patch("durak.normalizer.fast_normalize") as mock_fast:
+        assert normalizer("İSTANBUL") == "İSTANBUL"
+        mock_fast.assert_not_called()
+
+
 # --- Rust Fallback Test --- #
 def test_rust_extension_missing() -> None:
     """Test graceful failure when _durak_core is missing."""
@@ -18,3 +18,9 @@ def test_end_to_end_integration() -> None:
     result = normalizer("İSTANBUL")
 
     assert result == "istanbul"
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not installed")
+def test_fast_normalize_flags_default_to_true() -> None:
+    assert fast_normalize("İSTANBUL IĞDIR") == "istanbul ığdır"
+    assert fast_normalize("İSTANBUL", lowercase=False) == "iSTANBUL"
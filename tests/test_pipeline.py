@@ -7,6 +7,17 @@ from durak.normalizer import Normalizer
 from durak.pipeline import Pipeline, process_text, process_text_with_steps
 from durak.exceptions import ConfigurationError, PipelineError
 
+try:
+    from durak import _durak_core  # noqa: F401
+
+    RUST_AVAILABLE = True
+except ImportError:
+    RUST_AVAILABLE = False
+
+requires_rust = pytest.mark.skipif(
+    not RUST_AVAILABLE, reason="Rust extension not installed"
+)
+
 
 class TestNormalizer:
     """Tests for Normalizer class."""
@@ -17,7 +28,7 @@ class TestNormalizer:
 
     def test_normalizer_repr(self):
         norm = Normalizer()
-        assert "Normalizer" in repr(norm)
+        assert repr(norm) == "Normalizer(lowercase=True, handle_turkish_i=True)"
 
 
 class TestPipeline:
@@ -51,25 +62,16 @@ class TestPipeline:
 
     def test_pipeline_repr(self):
         pipe = Pipeline(["clean", "tokenize"])
-        assert "Pipeline" in repr(pipe)
-        assert "clean" in repr(pipe)
+        assert repr(pipe) == "Pipeline(['clean', 'tokenize'])"
 
+    @requires_rust
     def test_pipeline_execution_normalizer(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         pipe = Pipeline([Normalizer()])
         result = pipe("İSTANBUL ve IĞDIR")
         assert result == "istanbul ve ığdır"
 
+    @requires_rust
     def test_pipeline_execution_clean_tokenize(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         pipe = Pipeline(["clean", "tokenize"])
         result = pipe("Hello World!")
         assert isinstance(result, list)
@@ -81,6 +83,24 @@ class TestPipeline:
         with pytest.raises(PipelineError, match="must be a string"):
             pipe(12345)  # type: ignore[arg-type]
 
+    def test_pipeline_pipe_matches_single_calls(self):
+        pipe = Pipeline(["clean", "tokenize"])
+        texts = ["Merhaba dünya", "Nasılsın?", ""]
+        assert pipe.pipe(texts) == [pipe(text) for text in texts]
+        assert pipe.pipe([]) == []
+
+    def test_pipeline_sees_steps_added_after_construction(self):
+        pipe = Pipeline(["clean"])
+        pipe.step_names.append("tokenize")
+        pipe.steps.append(lambda text: text.split())
+        assert pipe("Merhaba dünya") == ["merhaba", "dünya"]
+        assert pipe.pipe(["Merhaba dünya"]) == [["merhaba", "dünya"]]
+
+    def test_pipeline_pipe_invalid_input_type(self):
+        pipe = Pipeline(["clean"])
+        with pytest.raises(PipelineError, match="must be a string"):
+            pipe.pipe(["ok", 12345])  # type: ignore[list-item]
+
     def test_pipeline_step_failure_wrapped(self):
         def bad_step(text: str):
             raise ValueError("Intentional error")
@@ -93,12 +113,8 @@ class TestPipeline:
 class TestProcessTextWithSteps:
     """Tests for process_text_with_steps function."""
 
+    @requires_rust
     def test_basic_usage(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         result = process_text_with_steps("Hello World!", ["clean", "tokenize"])
         assert isinstance(result, list)
         assert len(result) > 0
@@ -107,12 +123,8 @@ class TestProcessTextWithSteps:
 class TestProcessTextDeprecated:
     """Tests for deprecated process_text function."""
 
+    @requires_rust
     def test_deprecation_warning(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
             process_text("test text")
@@ -120,24 +132,16 @@ class TestProcessTextDeprecated:
             assert issubclass(w[0].category, DeprecationWarning)
             assert "deprecated" in str(w[0].message).lower()
 
+    @requires_rust
     def test_basic_processing(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", DeprecationWarning)
             result = process_text("Türkiye'de NLP zor!")
             assert isinstance(result, list)
             assert len(result) > 0
 
+    @requires_rust
     def test_remove_stopwords(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", DeprecationWarning)
             result = process_text("Bu bir test", remove_stopwords=True)
@@ -145,23 +149,15 @@ class TestProcessTextDeprecated:
             assert "bir" not in result
             assert "test" in result
 
+    @requires_rust
     def test_rejoin_suffixes(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", DeprecationWarning)
             result = process_text("Ankara ' da kaldım.", rejoin_suffixes=True)
             assert "ankara'da" in result
 
+    @requires_rust
     def test_strip_punct(self):
-        try:
-            from durak import _durak_core
-        except ImportError:
-            pytest.skip("Rust extension not installed")
-
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", DeprecationWarning)
             result = process_text("Hello!", strip_punct=True)
@@ -174,6 +170,14 @@ class TestProcessTextDeprecated:
             result = process_text("")
             assert result == []
 
+    def test_text_empty_after_cleaning(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            result = process_text(
+                "<p> https://example.com </p>", remove_stopwords=True
+            )
+            assert result == []
+
     def test_invalid_input_type(self):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", DeprecationWarning)
@@ -7,6 +7,7 @@ mathematical properties hold across all inputs.
 
 import pytest
 from hypothesis import given, settings, assume
+from hypothesis import strategies as st
 
 import durak
 from tests.strategies import (
@@ -140,6 +141,31 @@ class TestTokenizerProperties:
                 f"Overlapping tokens: [{start1}:{end1}] and [{start2}:{end2}]"
             )
 
+    @given(
+        st.one_of(
+            turkish_text_with_unicode_edge_cases(),
+            st.text(alphabet=st.characters(blacklist_categories=["Cs"])),
+        )
+    )
+    @settings(max_examples=200)
+    def test_tokenize_with_offsets_slices_back_to_token(self, text):
+        """Offsets must land on character boundaries and reproduce each token."""
+        for token, start, end in durak.tokenize_with_offsets(text):
+            assert text[start:end] == token
+
+    @given(
+        st.one_of(
+            turkish_text_with_unicode_edge_cases(),
+            st.text(alphabet=st.characters(blacklist_categories=["Cs"])),
+        )
+    )
+    @settings(max_examples=200)
+    def test_normalized_offsets_round_trip(self, text):
+        """Normalizing the original span must give the normalized token."""
+        normalizer = durak.Normalizer()
+        for token, start, end in durak.tokenize_with_normalized_offsets(text):
+            assert normalizer(text[start:end]) == token
+
 
 class TestStopwordProperties:
     """Property tests for stopword management."""
@@ -36,6 +36,17 @@ def test_load_stopwords_normalizes_entries(tmp_path: Path) -> None:
     assert loaded == {"servis", "veri"}
 
 
+def test_load_stopwords_picks_up_file_changes(tmp_path: Path) -> None:
+    source = tmp_path / "custom.txt"
+    source.write_text("servis\n", encoding="utf-8")
+    first = load_stopwords(source)
+    first.add("mutated")
+    assert load_stopwords(source) == {"servis"}
+
+    source.write_text("servis\nveri\n", encoding="utf-8")
+    assert load_stopwords(source) == {"servis", "veri"}
+
+
 def test_stopword_manager_respects_keep_words() -> None:
     manager = StopwordManager(keep=["ama"])
     assert manager.is_stopword("ve")
@@ -43,6 +54,15 @@ def test_stopword_manager_respects_keep_words() -> None:
     assert not manager.is_stopword("Ama")
 
 
+def test_stopword_manager_mutations_do_not_leak_into_base() -> None:
+    manager = StopwordManager()
+    manager.remove(["ve"])
+    manager.add(["api"])
+    assert "ve" in BASE_STOPWORDS
+    assert "api" not in BASE_STOPWORDS
+    assert StopwordManager().is_stopword("ve")
+
+
 def test_stopword_manager_additions_and_file_loading(
     tmp_path: Path, data_dir: Path
 ) -> None:
@@ -96,6 +116,15 @@ def test_remove_stopwords_filters_tokens() -> None:
     assert filtered == ["Durak"]
 
 
+def test_remove_stopwords_default_path_matches_manager() -> None:
+    tokens = ["Bu", "bir", "VE", "Durak", "", "İçin", "test"]
+    for case_sensitive in (False, True):
+        manager = StopwordManager(case_sensitive=case_sensitive)
+        assert remove_stopwords(tokens, case_sensitive=case_sensitive) == (
+            remove_stopwords(tokens, manager=manager)
+        )
+
+
 def test_legacy_resource_aliases_resolve() -> None:
     new_name = load_stopword_resource("domains/social_media")
     legacy_name = load_stopword_resource("tr/domains/social_media")
@@ -1,14 +1,26 @@
 import pytest
 
-from durak.tokenizer import tokenize_with_offsets, tokenize_with_normalized_offsets
+from durak.cleaning import normalize_case
+from durak.tokenizer import (
+    tokenize_with_normalized_offsets,
+    tokenize_with_normalized_offsets_batch,
+    tokenize_with_offsets,
+)
 
+try:
+    from durak import _durak_core  # noqa: F401
 
+    RUST_AVAILABLE = True
+except ImportError:
+    RUST_AVAILABLE = False
+
+requires_rust = pytest.mark.skipif(
+    not RUST_AVAILABLE, reason="Rust extension not installed"
+)
+
+
+@requires_rust
 def test_offset_mapping():
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     text = "Ali gel."
     # Ali (0,3), space (3,4), gel (4,7), . (7,8)
     # Our regex captures words and punctuation, but not spaces (unless they match?)
@@ -34,12 +46,8 @@ def test_offset_mapping():
         # Verify slicing matches
         assert text[start:end] == tok
 
+@requires_rust
 def test_turkish_offsets():
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     # Turkish characters have multi-byte UTF-8 representations.
     # Char offset logic must handle this. 'İ' is 2 bytes.
     text = "İğne" 
@@ -54,12 +62,8 @@ def test_turkish_offsets():
     assert tokens[0] == ("İğne", 0, 4)
     assert text[0:4] == "İğne"
     
+@requires_rust
 def test_mixed_content():
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     text = "Koş! (Hızlıca)"
     # Koş -> 0-3
     # ! -> 3-4
@@ -79,13 +83,9 @@ def test_mixed_content():
 # Tests for tokenize_with_normalized_offsets (NER-friendly version)
 # ============================================================================
 
+@requires_rust
 def test_normalized_offsets_istanbul():
     """Test İ→i normalization while preserving original offsets."""
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     text = "İstanbul"
     tokens = tokenize_with_normalized_offsets(text)
     
@@ -95,13 +95,9 @@ def test_normalized_offsets_istanbul():
     # Verify offset points to original text
     assert text[0:8] == "İstanbul"
 
+@requires_rust
 def test_normalized_offsets_i_dotless():
     """Test I→ı normalization while preserving original offsets."""
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     text = "IĞDIR"
     tokens = tokenize_with_normalized_offsets(text)
     
@@ -111,13 +107,9 @@ def test_normalized_offsets_i_dotless():
     # Verify offset points to original text
     assert text[0:5] == "IĞDIR"
 
+@requires_rust
 def test_normalized_offsets_apostrophe():
     """Test apostrophe handling with normalization."""
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     text = "Ankara'da"
     tokens = tokenize_with_normalized_offsets(text)
     
@@ -127,13 +119,9 @@ def test_normalized_offsets_apostrophe():
     # Verify offset points to original text
     assert text[0:9] == "Ankara'da"
 
+@requires_rust
 def test_normalized_offsets_sentence():
     """Test a full sentence with mixed case and Turkish characters."""
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     text = "İstanbul'a gittim."
     tokens = tokenize_with_normalized_offsets(text)
     
@@ -151,16 +139,13 @@ def test_normalized_offsets_sentence():
         
         # Verify offset points to original text (case-sensitive check)
         original_slice = text[start:end]
-        # Token is normalized but offset references original
-        assert original_slice.lower() == tok or original_slice == tok
+        # Token is normalized but offset references original; str.lower()
+        # would turn İ into i + U+0307, so compare with Turkish-aware casing
+        assert normalize_case(original_slice) == tok
 
+@requires_rust
 def test_normalized_offsets_ner_use_case():
     """Simulate NER use case: labels reference original text, tokens are normalized."""
-    try:
-        import _durak_core  # noqa: F401
-    except ImportError:
-        pytest.skip("Rust extension not installed")
-        
     # Simulated labeled data: entity "İstanbul" at position 0-8
     text = "İstanbul güzel bir şehir."
     entity_label = {"text": "İstanbul", "start": 0, "end": 8, "label": "LOC"}
@@ -179,3 +164,11 @@ def test_normalized_offsets_ner_use_case():
     assert entity_token is not None
     assert entity_token[0] == "istanbul"  # Normalized token
     assert text[entity_token[1]:entity_token[2]] == "İstanbul"  # Original text
+
+
+@requires_rust
+def test_normalized_offsets_batch_matches_single_calls():
+    """Batch tokenization returns the same result as one call per text."""
+    texts = ["İstanbul'a gittim.", "", "IĞDIR güzel bir şehir.", "Koş! (Hızlıca)"]
+    expected = [tokenize_with_normalized_offsets(text) for text in texts]
+    assert tokenize_with_normalized_offsets_batch(texts) == expected